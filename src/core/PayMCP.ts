@@ -36,13 +36,15 @@ export class PayMCP {
         }
         this.stateStore = opts.stateStore ?? new InMemoryStateStore();
 
-        if (Object.keys(this.providers).includes('x402') && this.flow !== Mode.X402 && this.flow !== Mode.AUTO) {
-            const newmode = Object.keys(this.providers).length > 1 ? Mode.AUTO : Mode.X402;
+        const providerNames = Object.keys(this.providers);
+        const hasX402 = 'x402' in this.providers;
+        if (hasX402 && this.flow !== Mode.X402 && this.flow !== Mode.AUTO) {
+            const newmode = providerNames.length > 1 ? Mode.AUTO : Mode.X402;
             this.logger.warn?.(`[PayMCP] ${this.flow} mode is not supported for x402 provider. Switching to ${newmode} mode.`);
             this.flow = newmode
         }
-        if (this.flow === Mode.X402 && !Object.keys(this.providers).includes('x402')) {
-            this.logger.warn?.(`[PayMCP] x402 mode is not supported for providers: '${Object.keys(this.providers).join(",")}'. Switching to ${Mode.RESUBMIT} mode.`);
+        if (this.flow === Mode.X402 && !hasX402) {
+            this.logger.warn?.(`[PayMCP] x402 mode is not supported for providers: '${providerNames.join(",")}'. Switching to ${Mode.RESUBMIT} mode.`);
             this.flow = Mode.RESUBMIT
         }
 
@@ -196,7 +198,7 @@ export class PayMCP {
         const patched = async (request: any, extra: any) => {
             const clientInfo = request?.params?.clientInfo ?? { "name": "Unknown client" };
             self.stateStore.set(`session-${extra.sessionId}`,{ name: clientInfo.name, sessionId: extra?.sessionId, capabilities: request?.params?.capabilities ?? {} },{ttlSeconds:60*60*24})//save for 24 hours
-            this.logger.debug(`[PayMCP] Client: ${JSON.stringify(clientInfo)}`);
+            this.logger.debug("[PayMCP] Client:", clientInfo);
             const res = await original(request, extra);
             return res;
         };
@@ -52,7 +52,9 @@ export const makePaidWrapper: PaidWrapperFactory = (
             paymentSigB64 = Buffer.from(JSON.stringify(extra._meta["x402/payment"]), "utf8").toString("base64");
         }
 
-        const clientInfo = await getClientInfo(extra.sessionId as string);
+        // Client info costs a state-store read and only v1 challenges and signatures
+        // without a challengeId need it, so it is fetched on demand rather than on every call.
+        const loadClientInfo = () => getClientInfo(extra.sessionId as string);
 
         if (!paymentSigB64) {
             const { paymentId, paymentData } = await provider.createPayment(
@@ -62,6 +64,7 @@ export const makePaidWrapper: PaidWrapperFactory = (
             );
             let challengeId: string = "";
             if (paymentData?.x402Version === 1) {
+                const clientInfo = await loadClientInfo();
                 if (!clientInfo) throw ("Session ID is not found");
                 challengeId = `${clientInfo.sessionId}-${toolName}`; //x402 v1 payment response doesn't return payment Requirements and can't set any extra data. So, the only way to save paymentData is to use session
             } else {
@@ -89,7 +92,12 @@ export const makePaidWrapper: PaidWrapperFactory = (
 
 
 
-        const challengeId = sig.accepted?.extra?.challengeId ?? `${clientInfo.sessionId}-${toolName}`
+        let challengeId = sig.accepted?.extra?.challengeId;
+        if (challengeId == null) {
+            const clientInfo = await loadClientInfo();
+            if (!clientInfo) throw ("Session ID is not found");
+            challengeId = `${clientInfo.sessionId}-${toolName}`;
+        }
 
         const normAddr = (a: any) => (typeof a === "string" ? a.toLowerCase() : "");
 
@@ -51,6 +51,7 @@ export class PayPalProvider extends BasePaymentProvider {
   private cancelUrl: string;
   private accessToken: string | null = null;
   private tokenExpiry: number = 0;
+  private tokenRequest: Promise<string> | null = null;
 
   constructor(opts: PayPalStandardOpts | PayPalProviderOpts) {
     let parsedOpts: PayPalProviderOpts;
@@ -100,6 +101,7 @@ export class PayPalProvider extends BasePaymentProvider {
   /**
    * Get OAuth 2.0 access token from PayPal.
    * Caches token until 5 minutes before expiry.
+   * Concurrent callers share a single in-flight token request.
    */
   private async getAccessToken(): Promise<string> {
     // Return cached token if still valid
@@ -107,6 +109,15 @@ export class PayPalProvider extends BasePaymentProvider {
       return this.accessToken;
     }
 
+    if (!this.tokenRequest) {
+      this.tokenRequest = this.fetchAccessToken().finally(() => {
+        this.tokenRequest = null;
+      });
+    }
+    return this.tokenRequest;
+  }
+
+  private async fetchAccessToken(): Promise<string> {
     this.logger.debug("[PayPalProvider] Fetching new access token");
 
     const auth = Buffer.from(
@@ -290,7 +290,8 @@ export class StripeProvider extends BasePaymentProvider {
       `[StripeProvider] cancelSubscription subscriptionId=${subscriptionId} userId=${userId}`,
     );
 
-    // Fetch the subscription first to validate ownership
+    // Fetch the subscription first to validate ownership. This must complete
+    // before findOrCreateCustomer, which may create or update a customer.
     const sub = await this.request<any>(
       "GET",
       `${BASE_URL}/subscriptions/${subscriptionId}`,
@@ -86,6 +86,7 @@ export class X402Provider extends BasePaymentProvider {
     private resourceInfo;
     private x402Version = 2;
     private feePayer:string | undefined;
+    private facilitatorHost: string | undefined;
 
     constructor(opts: X402ProviderOpts) {
         super("", opts.logger);
@@ -123,31 +124,17 @@ export class X402Provider extends BasePaymentProvider {
             this.x402Version = opts.x402Version;
         }
 
-        const feePayerRequired=this.payTo.filter(p=>p.network?.startsWith("solana"));
-        if (feePayerRequired.length) this._updateFacilitatorFeePayer(feePayerRequired[0].network as string);
+        const feePayerRequired=this.payTo.find(p=>p.network?.startsWith("solana")); //only the first Solana entry is used
+        if (feePayerRequired) this._updateFacilitatorFeePayer(feePayerRequired.network as string);
 
 
         this.logger.debug("[X402Provider] ready");
     }
 
     _updateFacilitatorFeePayer = async (network: string) => {
-        let headers: Record<string, string> = {
-            "Content-Type": "application/json",
-        };
-
-        if (this.facilitator.createAuthHeaders) {
-            const host = new URL(this.facilitator.url).host;
-            const authHeaders = this.facilitator.createAuthHeaders({
-                host,
-                method: "GET",
-                path: "/platform/v2/x402/supported",
-            });
-            if (authHeaders) headers = { ...headers, ...authHeaders };
-        }
-
         const supportedRes = await fetch(`${this.facilitator.url}/supported`, {
             method: "GET",
-            headers
+            headers: this.buildFacilitatorHeaders("GET", "/platform/v2/x402/supported")
         });
         if (!supportedRes.ok) {
             const errText = await supportedRes.text();
@@ -173,6 +160,27 @@ export class X402Provider extends BasePaymentProvider {
         this.logger.debug("[PayMCP] FeePayer for Solana", this.feePayer);
     }
 
+    /** Facilitator host for auth headers; parsed once, the URL is fixed after construction. */
+    private getFacilitatorHost(): string {
+        return this.facilitatorHost ??= new URL(this.facilitator.url).host;
+    }
+
+    /** JSON headers for a facilitator call, plus auth headers when configured. */
+    private buildFacilitatorHeaders(method: string, path: string): Record<string, string> {
+        const headers: Record<string, string> = {
+            "Content-Type": "application/json",
+        };
+        if (this.facilitator.createAuthHeaders) {
+            const authHeaders = this.facilitator.createAuthHeaders({
+                host: this.getFacilitatorHost(),
+                method,
+                path,
+            });
+            if (authHeaders) return { ...headers, ...authHeaders };
+        }
+        return headers;
+    }
+
     _createAuthHeadersForCDP = (opts?: CreateAuthHeadersProps) => {
         if (this.facilitator.apiKeyId && this.facilitator.apiKeySecret) {
             try {
@@ -296,63 +304,55 @@ export class X402Provider extends BasePaymentProvider {
             return "error";
         }
 
-        const networkStr = sig?.x402Version === 1 ? sig?.network : sig?.accepted?.network;
+        // Resolve the version-dependent fields once instead of re-probing sig per lookup.
+        const isV1 = sig?.x402Version === 1;
+        const networkMap = isV1 ? v1_network_map : v2_network_map;
+        const accepted = sig?.accepted;
+        const authorization = sig?.payload?.authorization;
+
+        const networkStr = isV1 ? sig?.network : accepted?.network;
         const isSolana = typeof networkStr === "string" && networkStr.startsWith("solana");
 
-        const payToAddress = sig?.x402Version === 1
-            ? sig?.payload?.authorization?.to
-            : (isSolana ? sig?.accepted?.payTo : sig?.payload?.authorization?.to);
+        const payToAddress = isV1
+            ? authorization?.to
+            : (isSolana ? accepted?.payTo : authorization?.to);
 
-        const choosenPayTo = this.payTo.find(pt => (networkStr === (sig?.x402Version===1 ? v1_network_map[pt.network as string] : v2_network_map[pt.network as string]) && payToAddress === pt.address));
+        const choosenPayTo = this.payTo.find(pt => (networkStr === networkMap[pt.network as string] && payToAddress === pt.address));
 
         if (!choosenPayTo) {
             this.logger.warn?.(`[X402Provider] getPaymentStatus invalid payTo`);
             return 'error';
         }
 
-        let headers: Record<string, string> = {
-            "Content-Type": "application/json",
-        };
-
-        if (this.facilitator.createAuthHeaders) {
-            const host = new URL(this.facilitator.url).host;
-            const authHeaders = this.facilitator.createAuthHeaders({
-                host,
-                method: "POST",
-                path: "/platform/v2/x402/verify",
-            });
-            if (authHeaders) headers = { ...headers, ...authHeaders };
-        }
-
-
-        const paymentRequirementsAll = sig?.x402Version === 1
+        const paymentRequirementsAll = isV1
             ? this.getPaymentRequirementsV1(0)?.accepts
             : this.getPaymentRequirementsV2(
-                sig.accepted?.extra?.challengeId,
+                accepted?.extra?.challengeId,
                 0,
-                sig.accepted?.extra?.description
+                accepted?.extra?.description
             )?.accepts;
         
-        const paymentRequirements=paymentRequirementsAll.find((pt)=>(networkStr === (sig?.x402Version===1 ? v1_network_map[pt.network as string] : v2_network_map[pt.network as string])));
+        const paymentRequirements=paymentRequirementsAll.find((pt)=>(networkStr === networkMap[pt.network as string]));
         if (!paymentRequirements) {
             this.logger.warn?.(`[PayMCP X402Provider] error locating requirements`);
             return 'error';
         }
-        if (sig?.x402Version === 1)
+        if (isV1)
             (paymentRequirements as any).maxAmountRequired=amountStr; //show  str amount
         else 
             (paymentRequirements as any).amount=amountStr; //show  str amount
 
-        const body = {
+        // Serialized once and reused for both /verify and /settle.
+        const body = JSON.stringify({
             x402Version: sig.x402Version,
             paymentPayload: sig,
             paymentRequirements
-        };
+        });
 
         const verifyRes = await fetch(`${this.facilitator.url}/verify`, {
             method: "POST",
-            headers,
-            body: JSON.stringify(body)
+            headers: this.buildFacilitatorHeaders("POST", "/platform/v2/x402/verify"),
+            body
         });
         if (!verifyRes.ok) {
             const errText = await verifyRes.text();
@@ -368,19 +368,10 @@ export class X402Provider extends BasePaymentProvider {
             return "error"
         }
 
-        if (this.facilitator.createAuthHeaders) {
-            const host = new URL(this.facilitator.url).host;
-            const authHeaders = this.facilitator.createAuthHeaders({
-                host,
-                method: "POST",
-                path: "/platform/v2/x402/settle",
-            });
-            if (authHeaders) headers = { ...headers, ...authHeaders };
-        }
         const settleRes = await fetch(`${this.facilitator.url}/settle`, {
             method: "POST",
-            headers,
-            body: JSON.stringify(body)
+            headers: this.buildFacilitatorHeaders("POST", "/platform/v2/x402/settle"),
+            body
         });
 
         if (!settleRes.ok) {
@@ -9,6 +9,16 @@ interface RedisLikeClient {
     eval(script: string, numKeys: number, ...args: Array<string | number>): Promise<any>;
 }
 
+// Lua script for atomic check-and-delete of a lock we own.
+// Built once at module load and reused for every release.
+const RELEASE_LOCK_SCRIPT = `
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    else
+        return 0
+    end
+`;
+
 export class RedisStateStore implements StateStore {
     private prefix: string;
     private ttl: number;
@@ -99,15 +109,7 @@ export class RedisStateStore implements StateStore {
             return await fn();
         } finally {
             // Release lock only if we still own it (check value matches)
-            // Use Lua script for atomic check-and-delete
-            const luaScript = `
-                if redis.call("get", KEYS[1]) == ARGV[1] then
-                    return redis.call("del", KEYS[1])
-                else
-                    return 0
-                end
-            `;
-            await this.redis.eval(luaScript, 1, lockKey, lockValue);
+            await this.redis.eval(RELEASE_LOCK_SCRIPT, 1, lockKey, lockValue);
         }
     }
 }
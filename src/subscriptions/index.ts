@@ -35,6 +35,7 @@ async function ensureSubscriptionAllowed(
     if (requiredPlans.length === 0) {
         return;
     }
+    const requiredPlanSet = new Set(requiredPlans);
 
     let subsResult: any;
     try {
@@ -81,7 +82,7 @@ async function ensureSubscriptionAllowed(
             s.status === "active" ||
             s.status === "trialing" ||
             s.status === "past_due";
-        return active && requiredPlans.includes(s.planId);
+        return active && requiredPlanSet.has(s.planId);
     });
 
     if (!hasRequired) {
@@ -110,7 +111,14 @@ async function ensureSubscriptionAllowed(
     }
 }
 
+// RFC 5321 limits a forward-path to 256 octets, i.e. 254 octets for the address itself.
+const MAX_EMAIL_OCTETS = 254;
+
 function isValidEmail(email: string): boolean {
+    // Reject non-strings and addresses over the RFC 5321 254-octet limit.
+    if (typeof email !== "string" || Buffer.byteLength(email, "utf8") > MAX_EMAIL_OCTETS) {
+        return false;
+    }
     // Basic email format validation to avoid using clearly invalid addresses
     return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);
 }
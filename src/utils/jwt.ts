@@ -7,6 +7,24 @@ type JwtPayload = {
   [key: string]: any;
 };
 
+// Buffer's base64 decoder silently skips characters outside the alphabet and
+// substitutes U+FFFD for invalid UTF-8, so the forgiving-base64 rules of atob
+// (both alphabets, ASCII whitespace, optional padding) are applied explicitly.
+const ASCII_WHITESPACE_RE = /[\t\n\f\r ]/g;
+const BASE64_RE = /^[A-Za-z0-9+/_-]*$/;
+const UTF8_STRICT = new TextDecoder("utf-8", { fatal: true, ignoreBOM: true });
+
+function decodeBase64Segment(segment: string): string {
+  let base64 = segment.replace(ASCII_WHITESPACE_RE, "");
+  if (base64.length % 4 === 0) {
+    base64 = base64.replace(/={1,2}$/, "");
+  }
+  if (base64.length % 4 === 1 || !BASE64_RE.test(base64)) {
+    throw new Error("Invalid JWT payload encoding");
+  }
+  return UTF8_STRICT.decode(Buffer.from(base64, "base64"));
+}
+
 /**
  * Decode JWT payload without verifying signature or claims.
  *
@@ -24,14 +42,9 @@ export function decodeJwtPayloadUnverified(token: string, log: Logger): JwtPaylo
       throw new Error("Invalid JWT format");
     }
 
-    const base64Url = parts[1];
-    const base64 = base64Url.replace(/-/g, "+").replace(/_/g, "/");
-    const json = decodeURIComponent(
-      atob(base64)
-        .split("")
-        .map((c) => "%" + ("00" + c.charCodeAt(0).toString(16)).slice(-2))
-        .join(""),
-    );
+    // Decode base64url straight to UTF-8 bytes; avoids a binary-string copy
+    // and the per-character percent-encoding round trip.
+    const json = decodeBase64Segment(parts[1]);
 
     const payload: JwtPayload = JSON.parse(json);
 
@@ -1,12 +1,17 @@
 // Normalize diverse provider status strings to canonical values used by PayMCP.
 type CanonicalStatus = "paid" | "canceled" | "pending";
+
+// Built once at module load; normalizeStatus runs on every status poll.
+const PAID_STATUSES: ReadonlySet<string> = new Set(["paid", "succeeded", "success", "complete", "completed", "ok", "no_payment_required"]);
+const CANCELED_STATUSES: ReadonlySet<string> = new Set(["canceled", "cancelled", "void", "failed", "declined", "error"]);
+
 export function normalizeStatus(raw: unknown): CanonicalStatus {
   const s = String(raw ?? "").toLowerCase();
-  if (["paid", "succeeded", "success", "complete", "completed", "ok", "no_payment_required"].includes(s)) {
+  if (PAID_STATUSES.has(s)) {
     return "paid";
   }
-  if (["canceled", "cancelled", "void", "failed", "declined", "error"].includes(s)) {
+  if (CANCELED_STATUSES.has(s)) {
     return "canceled";
   }
   return "pending";
-}
\ No newline at end of file
+}
@@ -112,6 +112,66 @@ describe('RESUBMIT x402 Flow', () => {
     ).rejects.toThrow('Unknown challenge ID');
   });
 
+  it('should not load client info for v2 signatures carrying a challenge ID', async () => {
+    const getClientInfo = vi.fn().mockResolvedValue(clientInfo());
+    const mockTool = vi.fn();
+    const wrapper = makePaidWrapper(
+      mockTool,
+      mockServer,
+      mockProviders,
+      priceInfo,
+      'testTool',
+      mockStateStore,
+      {},
+      getClientInfo,
+      mockLogger
+    );
+
+    const signature = encodeSignature({
+      payload: { authorization: { to: '0xPayTo' } },
+      accepted: {
+        amount: '1000000',
+        network: 'eip155:8453',
+        asset: '0xasset',
+        payTo: '0xPayTo',
+        extra: { challengeId: 'missing' }
+      }
+    });
+
+    await expect(
+      wrapper({ param: 'value' }, { requestInfo: { headers: { 'payment-signature': signature } } })
+    ).rejects.toThrow('Unknown challenge ID');
+    expect(getClientInfo).not.toHaveBeenCalled();
+  });
+
+  it('should reject signatures without a challenge ID when client info is missing', async () => {
+    const getClientInfo = vi.fn().mockResolvedValue(undefined);
+    const mockTool = vi.fn();
+    const wrapper = makePaidWrapper(
+      mockTool,
+      mockServer,
+      mockProviders,
+      priceInfo,
+      'testTool',
+      mockStateStore,
+      {},
+      getClientInfo,
+      mockLogger
+    );
+
+    const signature = encodeSignature({
+      x402Version: 1,
+      network: 'base',
+      payload: { authorization: { to: '0xPayTo', value: '1000000' } }
+    });
+
+    await expect(
+      wrapper({ param: 'value' }, { requestInfo: { headers: { 'payment-signature': signature } } })
+    ).rejects.toBe('Session ID is not found');
+    expect(getClientInfo).toHaveBeenCalledTimes(1);
+    expect(mockTool).not.toHaveBeenCalled();
+  });
+
   it('should reject mismatched signatures', async () => {
     storage.set('challenge_123', { args: { paymentData } });
 
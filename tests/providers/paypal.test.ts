@@ -236,6 +236,28 @@ describe('PayPalProvider', () => {
       expect(global.fetch).toHaveBeenCalled();
     });
 
+    it('should share one token request between concurrent callers', async () => {
+      const mockTokenResponse = {
+        access_token: 'shared_token_123',
+        token_type: 'Bearer',
+        expires_in: 3600
+      };
+
+      (global.fetch as any).mockResolvedValue({
+        ok: true,
+        json: () => Promise.resolve(mockTokenResponse)
+      });
+
+      const tokens = await Promise.all([
+        (provider as any).getAccessToken(),
+        (provider as any).getAccessToken(),
+        (provider as any).getAccessToken()
+      ]);
+
+      expect(tokens).toEqual(['shared_token_123', 'shared_token_123', 'shared_token_123']);
+      expect(global.fetch).toHaveBeenCalledTimes(1);
+    });
+
     it('should throw error when token request fails', async () => {
       (global.fetch as any).mockResolvedValue({
         ok: false,
@@ -247,6 +269,23 @@ describe('PayPalProvider', () => {
       );
     });
 
+    it('should retry token request after a failed attempt', async () => {
+      (global.fetch as any)
+        .mockResolvedValueOnce({
+          ok: false,
+          status: 500
+        })
+        .mockResolvedValueOnce({
+          ok: true,
+          json: () => Promise.resolve({ access_token: 'retry_token', token_type: 'Bearer', expires_in: 3600 })
+        });
+
+      await expect((provider as any).getAccessToken()).rejects.toThrow(
+        '[PayPalProvider] Failed to get access token: 500'
+      );
+      await expect((provider as any).getAccessToken()).resolves.toBe('retry_token');
+    });
+
     it('should calculate token expiry with 5-minute buffer', async () => {
       const mockTokenResponse = {
         access_token: 'buffered_token',
@@ -805,6 +805,24 @@ describe('StripeProvider', () => {
       ).rejects.toThrow('subscription does not belong to current user');
     });
 
+    it('should not touch customers when the subscription lookup fails', async () => {
+      (global.fetch as any).mockResolvedValueOnce({
+        ok: false,
+        status: 404,
+        text: () => Promise.resolve('No such subscription')
+      });
+
+      await expect(
+        provider.cancelSubscription('sub_missing', 'user123', 'user@example.com')
+      ).rejects.toThrow('HTTP 404');
+
+      const customerCalls = (global.fetch as any).mock.calls.filter(
+        (call: any[]) => String(call[0]).startsWith('https://api.stripe.com/v1/customers')
+      );
+      expect(customerCalls).toHaveLength(0);
+      expect(global.fetch).toHaveBeenCalledTimes(1);
+    });
+
     it('should handle string cancel_at value', async () => {
       const cancelAt = String(Math.floor(Date.now() / 1000) + 2592000);
 
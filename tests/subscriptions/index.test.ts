@@ -142,6 +142,66 @@ describe('makeSubscriptionWrapper', () => {
 
       expect(mockProvider.getSubscriptions).toHaveBeenCalledWith('user123', 'direct@example.com');
     });
+
+    it('should drop oversized email from authInfo.email', async () => {
+      mockProvider.getSubscriptions.mockResolvedValue({
+        current_subscriptions: [{ planId: 'plan_123', status: 'active' }],
+        available_subscriptions: []
+      });
+
+      const originalHandler = vi.fn().mockResolvedValue({ content: [{ type: 'text', text: 'ok' }] });
+
+      const wrapper = makeSubscriptionWrapper(
+        originalHandler,
+        mockServer,
+        mockProviders,
+        { plan: 'plan_123' },
+        'test_tool',
+        mockStateStore,
+        {},
+        mockLogger
+      );
+
+      const extra = { authInfo: { userId: 'user123', email: `${'a'.repeat(250)}@example.com` } };
+      await wrapper({}, extra);
+
+      expect(mockProvider.getSubscriptions).toHaveBeenCalledWith('user123', undefined);
+    });
+
+    it('should drop malformed email from authInfo.email', async () => {
+      mockProvider.getSubscriptions.mockResolvedValue({
+        current_subscriptions: [{ planId: 'plan_123', status: 'active' }],
+        available_subscriptions: []
+      });
+
+      const originalHandler = vi.fn().mockResolvedValue({ content: [{ type: 'text', text: 'ok' }] });
+
+      const wrapper = makeSubscriptionWrapper(
+        originalHandler,
+        mockServer,
+        mockProviders,
+        { plan: 'plan_123' },
+        'test_tool',
+        mockStateStore,
+        {},
+        mockLogger
+      );
+
+      const malformed = [
+        'a@b',      // no dot in domain
+        'a@.b',     // dot right after @
+        'a@b.',     // trailing dot
+        '@b.c',     // empty local part
+        'a@b@c.d',  // two @
+        'a b@c.d',  // whitespace
+      ];
+
+      for (const email of malformed) {
+        await wrapper({}, { authInfo: { userId: 'user123', email } });
+        expect(mockProvider.getSubscriptions).toHaveBeenLastCalledWith('user123', undefined);
+      }
+      expect(mockProvider.getSubscriptions).toHaveBeenCalledTimes(malformed.length);
+    });
   });
 
   describe('subscription validation', () => {
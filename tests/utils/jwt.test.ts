@@ -120,6 +120,46 @@ describe('decodeJwtPayloadUnverified', () => {
       expect(mockLogger.error).toHaveBeenCalledWith('Invalid JWT', expect.any(Error));
     });
 
+    it('should return null for payload with characters outside the base64url alphabet', () => {
+      // Without the stray "!*" this decodes to {"sub":"x"}
+      const result = decodeJwtPayloadUnverified('header.eyJz!*dWIiOiJ4In0.signature', mockLogger);
+
+      expect(result).toBeNull();
+      expect(mockLogger.error).toHaveBeenCalledWith('Invalid JWT', expect.any(Error));
+    });
+
+    it('should return null for payload that is not valid UTF-8', () => {
+      const invalidUtf8 = Buffer.concat([
+        Buffer.from('{"sub":"'),
+        Buffer.from([0xff]),
+        Buffer.from('"}')
+      ]).toString('base64url');
+      const result = decodeJwtPayloadUnverified(`header.${invalidUtf8}.signature`, mockLogger);
+
+      expect(result).toBeNull();
+      expect(mockLogger.error).toHaveBeenCalledWith('Invalid JWT', expect.anything());
+    });
+
+    it('should return null for payload whose length leaves a single trailing character', () => {
+      // 16 valid characters plus one extra: atob rejects a length of 1 (mod 4)
+      const payload = Buffer.from('{"sub":"xy"}').toString('base64url');
+      const result = decodeJwtPayloadUnverified(`header.${payload}A.signature`, mockLogger);
+
+      expect(result).toBeNull();
+      expect(mockLogger.error).toHaveBeenCalledWith('Invalid JWT', expect.any(Error));
+    });
+
+    it('should return null for payload with a leading UTF-8 BOM', () => {
+      const payload = Buffer.concat([
+        Buffer.from([0xef, 0xbb, 0xbf]),
+        Buffer.from('{"sub":"x"}')
+      ]).toString('base64url');
+      const result = decodeJwtPayloadUnverified(`header.${payload}.signature`, mockLogger);
+
+      expect(result).toBeNull();
+      expect(mockLogger.error).toHaveBeenCalledWith('Invalid JWT', expect.any(Error));
+    });
+
     it('should return null for invalid JSON in payload', () => {
       const invalidPayload = Buffer.from('not valid json').toString('base64');
       const result = decodeJwtPayloadUnverified(`header.${invalidPayload}.signature`, mockLogger);
@@ -138,6 +178,24 @@ describe('decodeJwtPayloadUnverified', () => {
       expect(result?.sub).toBe('user+test/special');
     });
 
+    it('should decode payload in the standard base64 alphabet with padding', () => {
+      const payload = Buffer.from(JSON.stringify({ sub: '?>?' })).toString('base64');
+      expect(payload).toMatch(/\/.*=$/);
+      const result = decodeJwtPayloadUnverified(`header.${payload}.signature`, mockLogger);
+
+      expect(result).not.toBeNull();
+      expect(result?.sub).toBe('?>?');
+    });
+
+    it('should ignore ASCII whitespace in payload', () => {
+      const payload = Buffer.from(JSON.stringify({ sub: 'user123' })).toString('base64url');
+      const spaced = `${payload.slice(0, 4)} \n${payload.slice(4, 10)}\t${payload.slice(10)}`;
+      const result = decodeJwtPayloadUnverified(`header.${spaced}.signature`, mockLogger);
+
+      expect(result).not.toBeNull();
+      expect(result?.sub).toBe('user123');
+    });
+
     it('should handle unicode characters in payload', () => {
       const payload = { sub: 'user123', name: '测试用户' };
       const token = createJwt(payload, 3600);